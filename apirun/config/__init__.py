@@ -21,6 +21,7 @@ class Config:
     DB_POOL_SIZE: int = 5
     MAX_WORKERS: int = 4
     HTTP_MAX_RETRIES: int = 3  # HTTP 请求最大重试次数
+    HTTP_REUSE_SESSION: bool = True  # 复用线程内 requests.Session（连接池 keep-alive）
 
     # 日志配置
     LOG_LEVEL: str = "INFO"
@@ -66,6 +67,9 @@ class Config:
         self.DB_POOL_SIZE = self._get_int("SISYPHUS_DB_POOL_SIZE", self.DB_POOL_SIZE)
         self.MAX_WORKERS = self._get_int("SISYPHUS_MAX_WORKERS", self.MAX_WORKERS)
         self.HTTP_MAX_RETRIES = self._get_int("SISYPHUS_HTTP_MAX_RETRIES", self.HTTP_MAX_RETRIES)
+        self.HTTP_REUSE_SESSION = self._get_bool(
+            "SISYPHUS_HTTP_REUSE_SESSION", self.HTTP_REUSE_SESSION
+        )
 
         # 日志配置
         self.LOG_LEVEL = os.getenv("SISYPHUS_LOG_LEVEL", self.LOG_LEVEL)
@@ -111,6 +115,7 @@ class Config:
                 "step_timeout": self.STEP_TIMEOUT,
                 "db_pool_size": self.DB_POOL_SIZE,
                 "max_workers": self.MAX_WORKERS,
+                "http_reuse_session": self.HTTP_REUSE_SESSION,
             },
             "logging": {
                 "log_level": self.LOG_LEVEL,
@@ -36,22 +36,24 @@
 - apirun/extractor/extractor.py: 变量提取
 """
 
+import time
 import uuid
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from apirun.core.models import CaseModel, Config, DbParams, ExtractRule, StepDefinition
+from apirun.core.models import CaseModel, Config, ExtractRule, StepDefinition
 from apirun.data_driven.driver import get_parameter_sets, run_data_driven
 from apirun.executor.custom import execute_custom_step_safe
-from apirun.executor.db import execute_db_step_safe
+from apirun.executor.db import execute_db_statements, execute_db_step_safe
 from apirun.executor.request import execute_request_step
 from apirun.extractor.extractor import run_extract_batch
 from apirun.parser.yaml_parser import parse_yaml
 from apirun.result.log_collector import LogCollector
-from apirun.result.models import ExecutionResult
+from apirun.result.models import ExecutionResult, ExtractResult
 from apirun.utils.variable_pool import VariablePool
 from apirun.validation.validator import run_assertion
+from apirun.websocket.publisher import NoOpPublisher
 
 
 def _build_full_url(base_url: str, relative_url: str) -> str:
@@ -105,6 +107,22 @@ def _step_result_base(
     }
 
 
+def _apply_extract_results(
+    pool: VariablePool, ex_results: list[ExtractResult]
+) -> tuple[list[dict[str, Any]], bool]:
+    """一次遍历提取结果：成功值写入变量池，返回 (结果字典列表, 是否存在失败项)。"""
+    dumped: list[dict[str, Any]] = []
+    any_failed = False
+    for er in ex_results:
+        dumped.append(er.model_dump())
+        if er.status == "success":
+            if er.value is not None:
+                pool.set(er.name, er.value, scope=er.scope)
+        elif er.status == "failed":
+            any_failed = True
+    return dumped, any_failed
+
+
 def run_case(
     case: CaseModel,
     data_driven_vars: dict[str, Any] | None = None,
@@ -112,10 +130,8 @@ def run_case(
     publisher: Any = None,
 ) -> ExecutionResult:
     """执行用例，返回 ExecutionResult 模型。支持数据驱动、日志收集与可选事件发布器（WS-004）。"""
-    from apirun.websocket.publisher import NoOpPublisher as _NoOp
-
     if publisher is None:
-        publisher = _NoOp()
+        publisher = NoOpPublisher()
     execution_id = f"exec-{uuid.uuid4().hex[:12]}"
     config: Config = case.config
     base_url = (config.base_url or "").strip()
@@ -159,13 +175,11 @@ def run_case(
 
     # RUN-018: 前置 SQL 执行
     if config.pre_sql:
-        for stmt in config.pre_sql.statements or []:
-            execute_db_step_safe(
-                DbParams(datasource=config.pre_sql.datasource, sql=stmt),
-                variables,
-            )
+        execute_db_statements(config.pre_sql.datasource, config.pre_sql.statements or [], variables)
 
     start_time = datetime.now(UTC)
+    # 时长用单调时钟计算；datetime 仅用于输出的起止时间戳
+    start_perf = time.perf_counter()
     steps_result: list[dict[str, Any]] = []
     total_assertions = 0
     passed_assertions = 0
@@ -230,11 +244,8 @@ def run_case(
                     # ──────────────────────────────────────────────────────────
                     if step.extract:
                         ex_results = run_extract_batch(step.extract, out, variables, db_rows=None)
-                        extract_results = [r.model_dump() for r in ex_results]
+                        extract_results, _ = _apply_extract_results(pool, ex_results)
                         total_extractions += len(ex_results)
-                        for er in ex_results:
-                            if er.status == "success" and er.value is not None:
-                                pool.set(er.name, er.value, scope=er.scope)
 
                     # ──────────────────────────────────────────────────────────
                     # 内联 VALIDATE 步骤 (RUN-014)
@@ -263,7 +274,7 @@ def run_case(
 
                 request_detail = {
                     "method": step.request.method or "GET",
-                    "url": _build_full_url(base_url, step.request.url),
+                    "url": req_url,
                     "headers": step.request.headers or {},
                     "params": step.request.params,
                     "body": step.request.json_body,
@@ -330,14 +341,10 @@ def run_case(
                 # RUN-010: 独立提取步骤
                 variables = pool.as_dict()
                 ex_results = run_extract_batch(step.extract, last_response, variables, db_rows=None)
-                extract_results = [r.model_dump() for r in ex_results]
+                extract_results, any_failed = _apply_extract_results(pool, ex_results)
                 total_extractions += len(ex_results)
-                any_failed = any(r.status == "failed" for r in ex_results)
                 if any_failed:
                     step_status = "failed"
-                for er in ex_results:
-                    if er.status == "success" and er.value is not None:
-                        pool.set(er.name, er.value, scope=er.scope)
                 step_end = datetime.now(UTC)
                 steps_result.append(
                     {
@@ -371,12 +378,9 @@ def run_case(
                             for r in step.db.extract
                         ]
                         ex_results = run_extract_batch(rules, variables=variables, db_rows=db_rows)
-                        extract_results = [r.model_dump() for r in ex_results]
+                        extract_results, any_failed = _apply_extract_results(pool, ex_results)
                         total_extractions += len(ex_results)
-                        for er in ex_results:
-                            if er.status == "success" and er.value is not None:
-                                pool.set(er.name, er.value, scope=er.scope)
-                        if any(r.status == "failed" for r in ex_results):
+                        if any_failed:
                             step_status = "failed"
                     if step.db.validate:
                         variables = pool.as_dict()
@@ -438,13 +442,10 @@ def run_case(
                         ex_results = run_extract_batch(
                             step.custom.extract, fake_response, variables, db_rows=None
                         )
-                        extract_results = [r.model_dump() for r in ex_results]
+                        extract_results, any_failed = _apply_extract_results(pool, ex_results)
                         total_extractions += len(ex_results)
-                        if any(r.status == "failed" for r in ex_results):
+                        if any_failed:
                             step_status = "failed"
-                        for er in ex_results:
-                            if er.status == "success" and er.value is not None:
-                                pool.set(er.name, er.value, scope=er.scope)
                 step_end = datetime.now(UTC)
                 steps_result.append(
                     {
@@ -495,14 +496,12 @@ def run_case(
     # RUN-019: 后置 SQL 执行（无论成功失败）
     if config.post_sql:
         variables = pool.as_dict()
-        for stmt in config.post_sql.statements or []:
-            execute_db_step_safe(
-                DbParams(datasource=config.post_sql.datasource, sql=stmt),
-                variables,
-            )
+        execute_db_statements(
+            config.post_sql.datasource, config.post_sql.statements or [], variables
+        )
 
     end_time = datetime.now(UTC)
-    duration_ms = int((end_time - start_time).total_seconds() * 1000)
+    duration_ms = int((time.perf_counter() - start_perf) * 1000)
     logs.info(f"场景执行完毕: {scenario_status} ({duration_ms}ms)")
     try:
         publisher.emit(
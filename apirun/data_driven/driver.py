@@ -49,9 +49,9 @@ def run_data_driven(
             None,
         )
 
+    total = len(param_list)
     runs: list[DataDrivenRun] = []
     passed = 0
-    failed = 0
     first_result: ExecutionResult | None = None
     for run_index, parameters in enumerate(param_list):
         result = run_case_fn(case, parameters)
@@ -60,25 +60,24 @@ def run_data_driven(
         status = result.status
         if status == "passed":
             passed += 1
-        else:
-            failed += 1
-        duration = result.duration
+        # summary / steps 均来自已校验的 ExecutionResult，用 model_construct 跳过重复校验
         runs.append(
-            DataDrivenRun(
+            DataDrivenRun.model_construct(
                 run_index=run_index,
                 parameters=parameters,
                 status=status,
-                duration=duration,
+                duration=result.duration,
                 summary=result.summary,
                 steps=result.steps,
             )
         )
-    pass_rate = round((passed / len(param_list)) * 100, 1) if param_list else 0.0
+    failed = total - passed
+    pass_rate = round((passed / total) * 100, 1) if total else 0.0
     ddr = DataDrivenResult(
         enabled=True,
         source=source,
         dataset_name=dataset_name,
-        total_runs=len(param_list),
+        total_runs=total,
         passed_runs=passed,
         failed_runs=failed,
         pass_rate=pass_rate,
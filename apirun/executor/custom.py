@@ -7,6 +7,7 @@ from typing import Any
 from apirun.core.models import CustomParams
 from apirun.errors import KEYWORD_EXECUTION_ERROR, KEYWORD_NOT_FOUND, EngineError
 from apirun.result.models import CustomDetail
+from apirun.utils.variables import render_template
 
 # 关键字注册表：keyword_name -> Keyword 子类
 KEYWORD_REGISTRY: dict[str, type] = {}
@@ -35,8 +36,6 @@ def execute_custom_step(
     """
     variables = variables or {}
     parameters = params.parameters or {}
-    from apirun.utils.variables import render_template
-
     parameters_rendered = {k: render_template(v, variables) for k, v in parameters.items()}
     start = time.perf_counter()
     try:
@@ -1,27 +1,91 @@
 """数据库执行器 — 执行 SQL 并返回 db_detail，支持 MySQL/PostgreSQL（DB-001～DB-011）"""
 
+import atexit
+import queue
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, ExitStack, contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
+from apirun.config import Config
 from apirun.core.models import DbParams
 from apirun.errors import (
     DB_CONNECTION_ERROR,
     DB_DATASOURCE_NOT_FOUND,
     DB_QUERY_ERROR,
+    VARIABLE_RENDER_ERROR,
     EngineError,
 )
 from apirun.result.models import DbDetail
 from apirun.security import sql_validator
-from apirun.utils.variables import render_template
+from apirun.utils.variables import VariableRenderError, render_template
+
+# 数据库驱动在模块加载时导入一次；未安装的驱动在使用时报 DB_CONNECTION_ERROR
+try:
+    import pymysql
+    import pymysql.cursors
+except ImportError:
+    pymysql = None
+
+try:
+    import psycopg2
+    from psycopg2.extras import RealDictCursor
+except ImportError:
+    psycopg2 = None
+    RealDictCursor = None
+
+
+_POSTGRES_DRIVERS = ("postgres", "postgresql", "psycopg2")
+
+
+@dataclass(frozen=True, slots=True)
+class ResolvedDataSource:
+    """规范化后的数据源配置：driver 已转小写，缺省值已填充，可哈希（兼作连接池键）。"""
+
+    driver: str
+    host: str
+    port: int
+    user: str
+    password: str
+    database: str
+    charset: str
+
+
+@lru_cache(maxsize=64)
+def _freeze_datasource(items: tuple[tuple[str, Any], ...]) -> ResolvedDataSource:
+    cfg = dict(items)
+    driver = (cfg.get("driver") or "mysql").lower()
+    default_port = 5432 if driver in _POSTGRES_DRIVERS else 3306
+    try:
+        port = int(cfg.get("port", default_port))
+    except (TypeError, ValueError) as e:
+        raise EngineError(
+            DB_CONNECTION_ERROR,
+            f"数据源端口无效: {cfg.get('port')!r}",
+        ) from e
+    return ResolvedDataSource(
+        driver=driver,
+        host=cfg.get("host", "localhost"),
+        port=port,
+        user=cfg.get("user", ""),
+        password=cfg.get("password", ""),
+        database=cfg.get("database", ""),
+        charset=cfg.get("charset", "utf8mb4"),
+    )
 
 
 def _resolve_datasource(
     datasource_name: str,
     variables: dict[str, Any],
-) -> dict[str, Any]:
+) -> ResolvedDataSource:
     """
     从变量池解析数据源配置（DB-001）。
-    期望 variables[datasource_name] 为 dict，含 host/port/user/password/database/driver。
+    期望 variables[datasource_name] 为 dict，含 host/port/user/password/database/driver；
+    相同配置只规范化一次。
     """
     cfg = variables.get(datasource_name)
     if cfg is None or not isinstance(cfg, dict):
@@ -29,86 +93,263 @@ def _resolve_datasource(
             DB_DATASOURCE_NOT_FOUND,
             f"数据源未找到: {datasource_name}",
         )
-    return cfg
+    items = tuple(sorted(cfg.items()))
+    try:
+        return _freeze_datasource(items)
+    except TypeError:
+        # 配置中含不可哈希的值（如嵌套 dict），跳过缓存
+        return _freeze_datasource.__wrapped__(items)
 
 
-def _execute_mysql(
-    conn_config: dict[str, Any], sql_rendered: str
-) -> tuple[list[str], list[dict[str, Any]]]:
-    """MySQL 查询，返回 (columns, rows)。"""
-    import pymysql
+# 连接池：按数据源配置分组缓存空闲连接，避免每个 db 步骤重新握手与认证
+_POOLS: dict[ResolvedDataSource, queue.LifoQueue[Any]] = {}
+_POOLS_LOCK = threading.Lock()
 
-    conn = pymysql.connect(
-        host=conn_config.get("host", "localhost"),
-        port=int(conn_config.get("port", 3306)),
-        user=conn_config.get("user", ""),
-        password=conn_config.get("password", ""),
-        database=conn_config.get("database", ""),
-        charset=conn_config.get("charset", "utf8mb4"),
-        cursorclass=pymysql.cursors.DictCursor,
-    )
+
+def _get_pool(key: ResolvedDataSource) -> queue.LifoQueue[Any]:
+    """获取（必要时创建）连接池，空闲连接上限取 Config.DB_POOL_SIZE。"""
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = queue.LifoQueue(maxsize=max(Config().DB_POOL_SIZE, 1))
+            _POOLS[key] = pool
+        return pool
+
+
+def _close_quietly(conn: Any) -> None:
     try:
-        with conn.cursor() as cur:
-            cur.execute(sql_rendered)
-            rows = cur.fetchall()
-            columns = list(rows[0].keys()) if rows else []
-            # 确保每行是 dict，且值为可 JSON 序列化
-            out = [dict(r) for r in rows]
-            return columns, out
-    finally:
         conn.close()
+    except Exception:
+        pass
 
 
-def _execute_postgres(
-    conn_config: dict[str, Any], sql_rendered: str
-) -> tuple[list[str], list[dict[str, Any]]]:
-    """PostgreSQL 查询，返回 (columns, rows)。"""
-    import psycopg2
-    from psycopg2.extras import RealDictCursor
-
-    conn = psycopg2.connect(
-        host=conn_config.get("host", "localhost"),
-        port=int(conn_config.get("port", 5432)),
-        user=conn_config.get("user", ""),
-        password=conn_config.get("password", ""),
-        dbname=conn_config.get("database", ""),
-    )
+@contextmanager
+def _pooled_connection(
+    key: ResolvedDataSource,
+    connect: Callable[[], Any],
+    is_alive: Callable[[Any], bool],
+) -> Iterator[Any]:
+    """从连接池借出连接，用完回滚并归还；失效或回滚失败的连接直接关闭。"""
+    pool = _get_pool(key)
+    conn = None
+    while conn is None:
+        try:
+            candidate = pool.get_nowait()
+        except queue.Empty:
+            conn = connect()
+            break
+        if is_alive(candidate):
+            conn = candidate
+        else:
+            _close_quietly(candidate)
     try:
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute(sql_rendered)
-            rows = cur.fetchall()
-            columns = list(rows[0].keys()) if rows else []
-            out = [dict(r) for r in rows]
-            return columns, out
+        yield conn
     finally:
-        conn.close()
+        # 与原先「用完即关闭」保持一致：未提交的事务一律丢弃，下次借出时读取最新快照
+        try:
+            conn.rollback()
+            pool.put_nowait(conn)
+        except Exception:
+            _close_quietly(conn)
 
 
-def execute_db_step(
-    params: DbParams,
-    variables: dict[str, Any] | None = None,
-) -> dict[str, Any]:
-    """
-    执行数据库步骤（DB-002～DB-006）。
-    返回: db_detail (dict), rows (list), error (dict|None)
+def close_db_pools() -> None:
+    """关闭并清空所有连接池中的空闲连接（进程退出或测试清理时调用）。"""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        while True:
+            try:
+                _close_quietly(pool.get_nowait())
+            except queue.Empty:
+                break
+
+
+atexit.register(close_db_pools)
+
+
+# 结果集分批读取的批大小
+_FETCH_BATCH_SIZE = 1000
+
+
+def _fetch_rows(cur: Any) -> tuple[list[str], list[dict[str, Any]]]:
+    """分批读取结果集，返回 (columns, rows)。
+
+    有结果行时列名取自首行的 key，与行内容保持一致（同名列在 DictCursor 中会改名为
+    「表名.列名」，在 RealDictCursor 中会合并）；空结果时取自 cursor.description。
+    DictCursor / RealDictCursor 返回的行本身就是 dict，无需再复制一遍。
+    无结果集的语句（如 INSERT）返回空列表。
     """
-    variables = variables or {}
+    if cur.description is None:
+        return [], []
+    rows: list[dict[str, Any]] = []
+    while True:
+        chunk = cur.fetchmany(_FETCH_BATCH_SIZE)
+        if not chunk:
+            break
+        rows.extend(chunk)
+    if rows:
+        return list(rows[0].keys()), rows
+    return [d[0] for d in cur.description], rows
+
+
+def _mysql_alive(conn: Any) -> bool:
+    """复用前 ping 一次，避免拿到已被服务端断开的连接（MySQL server has gone away）。"""
     try:
-        conn_config = _resolve_datasource(params.datasource, variables)
-    except EngineError as e:
-        return {
-            "db_detail": None,
-            "rows": [],
-            "error": e.to_dict(),
-        }
+        conn.ping(reconnect=True)
+        return True
+    except Exception:
+        return False
+
+
+def _postgres_alive(conn: Any) -> bool:
+    return conn.closed == 0
+
+
+def _require(module: Any, name: str) -> Any:
+    if module is None:
+        raise EngineError(DB_CONNECTION_ERROR, f"数据库驱动未安装: {name}")
+    return module
+
+
+def _mysql_connection(ds: ResolvedDataSource) -> AbstractContextManager[Any]:
+    """从连接池借出 MySQL 连接。"""
+    driver = _require(pymysql, "pymysql")
+
+    def connect() -> Any:
+        return driver.connect(
+            host=ds.host,
+            port=ds.port,
+            user=ds.user,
+            password=ds.password,
+            database=ds.database,
+            charset=ds.charset,
+            cursorclass=driver.cursors.DictCursor,
+        )
+
+    return _pooled_connection(ds, connect, _mysql_alive)
 
+
+def _run_mysql(conn: Any, sql_rendered: str) -> tuple[list[str], list[dict[str, Any]]]:
+    """在已借出的 MySQL 连接上执行一条 SQL。"""
+    with conn.cursor() as cur:
+        cur.execute(sql_rendered)
+        return _fetch_rows(cur)
+
+
+def _postgres_connection(ds: ResolvedDataSource) -> AbstractContextManager[Any]:
+    """从连接池借出 PostgreSQL 连接。"""
+    driver = _require(psycopg2, "psycopg2")
+
+    def connect() -> Any:
+        return driver.connect(
+            host=ds.host,
+            port=ds.port,
+            user=ds.user,
+            password=ds.password,
+            dbname=ds.database,
+        )
+
+    return _pooled_connection(ds, connect, _postgres_alive)
+
+
+def _run_postgres(conn: Any, sql_rendered: str) -> tuple[list[str], list[dict[str, Any]]]:
+    """在已借出的 PostgreSQL 连接上执行一条 SQL。"""
+    with conn.cursor(cursor_factory=RealDictCursor) as cur:
+        cur.execute(sql_rendered)
+        return _fetch_rows(cur)
+
+
+# driver 名称 → (借出连接, 在连接上执行 SQL)
+_DriverOps = tuple[
+    Callable[[ResolvedDataSource], AbstractContextManager[Any]],
+    Callable[[Any, str], tuple[list[str], list[dict[str, Any]]]],
+]
+_MYSQL: _DriverOps = (_mysql_connection, _run_mysql)
+_POSTGRES: _DriverOps = (_postgres_connection, _run_postgres)
+_DRIVERS: dict[str, _DriverOps] = {
+    "mysql": _MYSQL,
+    "pymysql": _MYSQL,
+    "postgres": _POSTGRES,
+    "postgresql": _POSTGRES,
+    "psycopg2": _POSTGRES,
+}
+
+
+def _driver_ops(ds: ResolvedDataSource) -> _DriverOps:
+    """按数据源 driver 查表；不支持时抛出 EngineError。"""
+    ops = _DRIVERS.get(ds.driver)
+    if ops is None:
+        raise EngineError(
+            DB_CONNECTION_ERROR,
+            f"不支持的数据库驱动: {ds.driver}",
+        )
+    return ops
+
+
+# 已通过安全校验的渲染后 SQL（LRU，上限 _VALIDATED_SQL_MAX）；校验失败的 SQL 不缓存
+_VALIDATED_SQL: OrderedDict[str, None] = OrderedDict()
+_VALIDATED_SQL_MAX = 1024
+_VALIDATED_SQL_LOCK = threading.Lock()
+
+
+def _validate_sql(sql_rendered: str) -> None:
+    """SQL 安全校验，同一条 SQL 只校验一次；不通过时抛出 EngineError。"""
+    with _VALIDATED_SQL_LOCK:
+        if sql_rendered in _VALIDATED_SQL:
+            _VALIDATED_SQL.move_to_end(sql_rendered)
+            return
+    sql_validator.validate(sql_rendered)
+    with _VALIDATED_SQL_LOCK:
+        _VALIDATED_SQL[sql_rendered] = None
+        if len(_VALIDATED_SQL) > _VALIDATED_SQL_MAX:
+            _VALIDATED_SQL.popitem(last=False)
+
+
+# 连接阶段异常（网络不可达、认证失败、连接中断）归为 DB_CONNECTION_ERROR，其余为 DB_QUERY_ERROR
+_CONNECTION_ERRORS: tuple[type[BaseException], ...] = (OSError,)
+if pymysql is not None:
+    _CONNECTION_ERRORS += (pymysql.err.InterfaceError,)
+if psycopg2 is not None:
+    _CONNECTION_ERRORS += (psycopg2.InterfaceError,)
+
+
+def _is_connection_error(e: Exception) -> bool:
+    """按异常类型区分连接错误与查询错误。
+
+    pymysql 的 OperationalError 同时覆盖服务端报错（如 1054 未知列），
+    仅客户端错误码 2000～2999（无法连接、连接断开等）视为连接错误。
+    psycopg2 的 OperationalError 同样覆盖语句超时、死锁、磁盘满等查询级错误：
+    带 SQLSTATE 时仅 08 类（连接异常）视为连接错误；无 SQLSTATE 时仅客户端直接抛出的
+    OperationalError 本类（无法连接、连接被关闭）视为连接错误，其子类均按查询错误处理。
+    """
+    if isinstance(e, _CONNECTION_ERRORS):
+        return True
+    if pymysql is not None and isinstance(e, pymysql.err.OperationalError):
+        errno = e.args[0] if e.args else None
+        return isinstance(errno, int) and 2000 <= errno < 3000
+    if psycopg2 is not None and isinstance(e, psycopg2.OperationalError):
+        pgcode = getattr(e, "pgcode", None)
+        if pgcode:
+            return pgcode.startswith("08")
+        return type(e) is psycopg2.OperationalError
+    return False
+
+
+def _run_statement(
+    params: DbParams,
+    variables: dict[str, Any],
+    run: Callable[[str], tuple[list[str], list[dict[str, Any]]]],
+) -> dict[str, Any]:
+    """渲染、校验并通过 run 执行一条 SQL，返回 db_detail / rows / error。"""
     sql_rendered = render_template(params.sql, variables)
     if not isinstance(sql_rendered, str):
         sql_rendered = str(sql_rendered)
 
     # SQL 安全验证（防止注入攻击）
     try:
-        sql_validator.validate(sql_rendered)
+        _validate_sql(sql_rendered)
     except EngineError as e:
         return {
             "db_detail": None,
@@ -116,7 +357,6 @@ def execute_db_step(
             "error": e.to_dict(),
         }
 
-    driver = (conn_config.get("driver") or "mysql").lower()
     start = time.perf_counter()
     empty_detail = {
         "datasource": params.datasource,
@@ -128,28 +368,13 @@ def execute_db_step(
         "execution_time": 0,
     }
     try:
-        if driver in ("mysql", "pymysql"):
-            columns, rows = _execute_mysql(conn_config, sql_rendered)
-        elif driver in ("postgres", "postgresql", "psycopg2"):
-            columns, rows = _execute_postgres(conn_config, sql_rendered)
-        else:
-            raise EngineError(
-                DB_CONNECTION_ERROR,
-                f"不支持的数据库驱动: {driver}",
-            )
+        columns, rows = run(sql_rendered)
     except EngineError:
         raise
     except Exception as e:
         elapsed_ms = int((time.perf_counter() - start) * 1000)
         empty_detail["execution_time"] = elapsed_ms
-        # 连接阶段异常多为 DB_CONNECTION_ERROR，执行阶段为 DB_QUERY_ERROR
-        code = DB_QUERY_ERROR
-        if (
-            "connect" in str(e).lower()
-            or "connection" in str(e).lower()
-            or "refused" in str(e).lower()
-        ):
-            code = DB_CONNECTION_ERROR
+        code = DB_CONNECTION_ERROR if _is_connection_error(e) else DB_QUERY_ERROR
         return {
             "db_detail": empty_detail,
             "rows": [],
@@ -169,6 +394,85 @@ def execute_db_step(
     return {"db_detail": db_detail, "rows": rows, "error": None}
 
 
+def execute_db_step(
+    params: DbParams,
+    variables: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """
+    执行数据库步骤（DB-002～DB-006）。
+    返回: db_detail (dict), rows (list), error (dict|None)
+    """
+    variables = variables or {}
+    try:
+        ds = _resolve_datasource(params.datasource, variables)
+    except EngineError as e:
+        return {
+            "db_detail": None,
+            "rows": [],
+            "error": e.to_dict(),
+        }
+
+    def run(sql_rendered: str) -> tuple[list[str], list[dict[str, Any]]]:
+        connection, run_on = _driver_ops(ds)
+        with connection(ds) as conn:
+            return run_on(conn, sql_rendered)
+
+    return _run_statement(params, variables, run)
+
+
+def execute_db_statements(
+    datasource: str,
+    statements: list[str],
+    variables: dict[str, Any] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    在同一数据源上顺序执行多条 SQL（前置/后置 SQL 等），整批只借出一次连接（RUN-018/019）。
+    按语句顺序返回与 execute_db_step_safe 相同结构的结果；单条失败回滚后继续执行后续语句。
+    """
+    variables = variables or {}
+    if not statements:
+        return []
+    try:
+        ds = _resolve_datasource(datasource, variables)
+        connection, run_on = _driver_ops(ds)
+    except EngineError as e:
+        return [{"db_detail": None, "rows": [], "error": e.to_dict()} for _ in statements]
+
+    results: list[dict[str, Any]] = []
+    with ExitStack() as stack:
+        try:
+            conn = stack.enter_context(connection(ds))
+        except Exception as e:
+            # 借出连接失败：整批语句均记为连接错误
+            error = EngineError(DB_CONNECTION_ERROR, str(e)).to_dict()
+            return [{"db_detail": None, "rows": [], "error": dict(error)} for _ in statements]
+
+        for sql in statements:
+            try:
+                out = _run_statement(
+                    DbParams(datasource=datasource, sql=sql),
+                    variables,
+                    lambda sql_rendered: run_on(conn, sql_rendered),
+                )
+            except VariableRenderError as e:
+                # 单条语句渲染失败只影响该语句，后续语句（如后置清理 SQL）照常执行
+                out = {
+                    "db_detail": None,
+                    "rows": [],
+                    "error": EngineError(VARIABLE_RENDER_ERROR, str(e)).to_dict(),
+                }
+            except EngineError as e:
+                out = {"db_detail": None, "rows": [], "error": e.to_dict()}
+            if out["error"]:
+                # 失败语句可能使事务处于中止状态（PostgreSQL），回滚后再执行下一条
+                try:
+                    conn.rollback()
+                except Exception:
+                    pass
+            results.append(out)
+    return results
+
+
 def execute_db_step_safe(
     params: DbParams,
     variables: dict[str, Any] | None = None,
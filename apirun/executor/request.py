@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import logging
+import re
+import threading
 import time
+from http.cookiejar import DefaultCookiePolicy
 from pathlib import Path
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from apirun.config import Config
 from apirun.core.models import RequestStepParams
 from apirun.utils.minio_client import download_to_temp
 from apirun.utils.retry import execute_with_retry
@@ -16,9 +21,54 @@ from apirun.utils.variables import render_template
 
 logger = logging.getLogger("sisyphus")
 
+# 可选依赖：安装了 orjson 时用其解析 JSON 响应体，未安装时回退到 resp.json()
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# 可选依赖：大响应体（>= _SIMDJSON_MIN_SIZE 字节）优先用 pysimdjson（SIMD 解析）
+try:
+    import simdjson as _simdjson  # type: ignore[reportMissingImports]
+except ImportError:
+    _simdjson = None
+
+_SIMDJSON_MIN_SIZE = 1_000_000
+
+# orjson / simdjson 仅支持 64 位整数：超过 64 位的整数会被转成 float 或直接报错。
+# 响应体中出现 20 位及以上的连续数字时改用 resp.json()，保证大整数（如长 ID）精确
+_LONG_DIGITS_PATTERN = re.compile(rb"\d{20}")
+# 首个非空白字节可能开始一个 JSON 值：标准库额外接受的 NaN / Infinity，
+# 以及 BOM、UTF-16/32 编码的首字节（交给 resp.json() 按编码识别）
+_JSON_START_PATTERN = re.compile(rb'[ \t\n\r]*[\[{"\-0-9tfnNI\x00\xef\xfe\xff]')
+
+# 每个线程一个 Session：CookieJar 非线程安全，线程内复用即可获得连接池 keep-alive
+_SESSION_LOCAL = threading.local()
+
+
+def _get_session() -> requests.Session:
+    """获取当前线程复用的 Session，同一主机的后续步骤免去 TCP/TLS 握手。
+
+    Session 的 CookieJar 拒绝保存任何 Cookie：步骤之间不会自动携带上一响应的 Cookie，
+    与逐次调用 requests.request 的语义保持一致（显式 cookies 参数与 resp.cookies 不受影响）。
+    """
+    session = getattr(_SESSION_LOCAL, "session", None)
+    if session is None:
+        session = requests.Session()
+        # 重试由 execute_with_retry 负责，适配器层不再重试
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        _SESSION_LOCAL.session = session
+    return session
+
 
 def _prepare_files(files: Any) -> tuple[Any, list[Path], list[Any]]:
-    """预处理 files 参数，支持 MinIO 路径自动下载为临时文件。"""
+    """预处理 files 参数，支持 MinIO 路径自动下载为临时文件。
+
+    同一 files 中重复引用的 MinIO 路径只下载一次；返回 (files, 临时文件, 文件句柄)。
+    """
     if files is None:
         return None, [], []
 
@@ -27,20 +77,55 @@ def _prepare_files(files: Any) -> tuple[Any, list[Path], list[Any]]:
 
     if isinstance(files, dict):
         prepared: dict[str, Any] = {}
-        for field, value in files.items():
-            if isinstance(value, str):
-                temp_path = download_to_temp(value)
-                temp_paths.append(temp_path)
-                fh = temp_path.open("rb")
-                file_handles.append(fh)
-                prepared[field] = (temp_path.name, fh)
-            else:
-                prepared[field] = value
+        downloaded: dict[str, Path] = {}
+        try:
+            for field, value in files.items():
+                if isinstance(value, str):
+                    temp_path = downloaded.get(value)
+                    if temp_path is None:
+                        temp_path = download_to_temp(value)
+                        downloaded[value] = temp_path
+                        temp_paths.append(temp_path)
+                    fh = temp_path.open("rb")
+                    file_handles.append(fh)
+                    prepared[field] = (temp_path.name, fh)
+                else:
+                    prepared[field] = value
+        except BaseException:
+            # 部分字段失败：关闭已打开的句柄并删除已下载的临时文件
+            for fh in file_handles:
+                fh.close()
+            for path in temp_paths:
+                path.unlink(missing_ok=True)
+            raise
         return prepared, temp_paths, file_handles
 
     return files, temp_paths, file_handles
 
 
+def _parse_body(resp: requests.Response) -> Any:
+    """解析响应体：能按 JSON 解析则返回 JSON 值，否则返回文本。"""
+    content = resp.content
+    loads = None
+    if not _LONG_DIGITS_PATTERN.search(content):
+        if _simdjson is not None and len(content) >= _SIMDJSON_MIN_SIZE:
+            loads = _simdjson.loads
+        elif _orjson is not None:
+            loads = _orjson.loads
+    if loads is not None:
+        try:
+            return loads(content)
+        except (ValueError, RuntimeError):
+            # 严格解析器不接受 NaN、孤立代理项转义等标准库可解析的写法，也不识别其他编码，
+            # 拒绝后仍交给 resp.json() 再试；仅当首字节不可能开始 JSON 值时直接返回文本
+            if not _JSON_START_PATTERN.match(content):
+                return resp.text
+    try:
+        return resp.json()
+    except Exception:
+        return resp.text
+
+
 def execute_request_step(
     params: RequestStepParams,
     base_url: str = "",
@@ -62,15 +147,24 @@ def execute_request_step(
     if base_url and not url.startswith(("http://", "https://")):
         url = (base_url.rstrip("/") + "/" + url.lstrip("/")) if url else base_url
 
-    # 渲染其余请求参数
-    headers = render_template(params.headers, variables)
-    query_params = render_template(params.params, variables)
-    json_body = (
-        render_template(params.json_body, variables) if params.json_body is not None else None
+    # 其余请求参数组装成一个 dict 一次性递归渲染（None 原样返回）
+    rendered = render_template(
+        {
+            "headers": params.headers,
+            "params": params.params,
+            "json": params.json_body,
+            "data": params.data,
+            "files": params.files,
+            "cookies": params.cookies,
+        },
+        variables,
     )
-    data = render_template(params.data, variables) if params.data is not None else None
-    files_raw = render_template(params.files, variables) if params.files is not None else None
-    cookies = render_template(params.cookies, variables)
+    headers = rendered["headers"]
+    query_params = rendered["params"]
+    json_body = rendered["json"]
+    data = rendered["data"]
+    files_raw = rendered["files"]
+    cookies = rendered["cookies"]
 
     method = (params.method or "GET").upper()
     start = time.perf_counter()
@@ -79,9 +173,10 @@ def execute_request_step(
     try:
         files, temp_paths, file_handles = _prepare_files(files_raw)
 
-        # 使用重试机制执行请求
+        # 使用重试机制执行请求；默认复用线程内 Session，可通过配置关闭
+        send = _get_session().request if Config().HTTP_REUSE_SESSION else requests.request
         resp = execute_with_retry(
-            requests.request,
+            send,
             method=method,
             url=url,
             headers=headers,
@@ -95,10 +190,7 @@ def execute_request_step(
             verify=params.verify,
         )
         elapsed_ms = int((time.perf_counter() - start) * 1000)
-        try:
-            body = resp.json()
-        except Exception:
-            body = resp.text
+        body = _parse_body(resp)
         return {
             "status_code": resp.status_code,
             "headers": dict(resp.headers),
@@ -3,10 +3,9 @@
 import logging
 from typing import Any
 
-from jsonpath_ng import parse as jsonpath_parse
-
 from apirun.core.models import ExtractRule
 from apirun.result.models import ExtractResult
+from apirun.utils.jsonpath import find_values
 
 logger = logging.getLogger("sisyphus")
 
@@ -16,23 +15,30 @@ def _extract_json(body: Any, expression: str) -> Any:
     if body is None:
         return None
     try:
-        expr = jsonpath_parse(expression)
-        matches = expr.find(body)
-        if not matches:
+        values = find_values(body, expression)
+        if not values:
             return None
-        if len(matches) == 1:
-            return matches[0].value
-        return [m.value for m in matches]
+        if len(values) == 1:
+            return values[0]
+        return values
     except (AttributeError, ValueError, TypeError) as e:
-        logger.debug(f"JSONPath 提取失败: expression={expression}, 错误: {e}")
+        # 失败分支在批量提取中高频出现，交由 logging 按级别惰性格式化
+        logger.debug("JSONPath 提取失败: expression=%s, 错误: %s", expression, e)
         return None
     except Exception:
-        logger.error(f"JSONPath 提取发生未预期错误: expression={expression}", exc_info=True)
+        logger.error("JSONPath 提取发生未预期错误: expression=%s", expression, exc_info=True)
         return None
 
 
-def _extract_header(headers: dict[str, Any], name: str) -> Any:
-    """从 headers 按名称取值（大小写不敏感）。"""
+def _header_index(headers: dict[str, Any]) -> dict[str, Any]:
+    """构建小写名称 -> 值的 header 索引；仅大小写不同的重复名保留首个，与逐项扫描一致。"""
+    return {k.lower(): v for k, v in reversed(headers.items())}
+
+
+def _extract_header(headers: dict[str, Any], name: str, index: dict[str, Any] | None = None) -> Any:
+    """从 headers 按名称取值（大小写不敏感）；传入 index 时直接查索引。"""
+    if index is not None:
+        return index.get(name.strip().lower())
     if not headers:
         return None
     name_lower = name.strip().lower()
@@ -54,10 +60,12 @@ def _get_value(
     response: dict[str, Any] | None,
     variables: dict[str, Any],
     db_rows: list[dict[str, Any]] | None = None,
+    header_index: dict[str, Any] | None = None,
 ) -> Any:
     """
     根据 rule.type 与 rule.source_variable 从 response / variables / db_rows 提取值。
     source_variable 指定时从 variables[source_variable] 取数据源（视为 response 结构）；否则用 response。
+    header_index 为 response headers 的小写索引，仅在未指定 source_variable 时使用。
     """
     # 数据源：默认上一请求响应，或 source_variable 指向的变量（EXT-009）
     data_source = response
@@ -72,7 +80,9 @@ def _get_value(
 
     if rule.type == "header":
         headers = (data_source or {}).get("headers") or {}
-        return _extract_header(headers, rule.expression)
+        if data_source is not response:
+            header_index = None
+        return _extract_header(headers, rule.expression, header_index)
 
     if rule.type == "cookie":
         cookies = (data_source or {}).get("cookies") or {}
@@ -91,15 +101,17 @@ def run_extract(
     response: dict[str, Any] | None = None,
     variables: dict[str, Any] | None = None,
     db_rows: list[dict[str, Any]] | None = None,
+    header_index: dict[str, Any] | None = None,
 ) -> ExtractResult:
     """
     执行单条提取规则，返回 ExtractResult（EXT-001～EXT-008）。
     - 提取失败且有 default 时使用 default、status=success（EXT-006）。
     - 提取失败且无 default 时 value 为 None、status=failed（EXT-007）。
     - scope 原样写入结果，供调用方写入对应变量池（EXT-004/005）。
+    - header_index 为可选的 response headers 小写索引，由批量提取预先构建。
     """
     variables = variables or {}
-    value = _get_value(rule, response, variables, db_rows)
+    value = _get_value(rule, response, variables, db_rows, header_index)
 
     # 提取失败：无匹配或数据源缺失
     failed = value is None and (rule.type != "json" or rule.expression != "$")
@@ -126,4 +138,13 @@ def run_extract_batch(
     db_rows: list[dict[str, Any]] | None = None,
 ) -> list[ExtractResult]:
     """批量执行提取规则，返回按规则顺序的 ExtractResult 列表。"""
-    return [run_extract(r, response, variables, db_rows) for r in rules]
+    # 多条 header 规则共用同一 response 时，小写索引只构建一次，避免逐条全量扫描
+    header_index = None
+    header_rules = sum(
+        1
+        for r in rules
+        if r.type == "header" and not (r.source_variable and r.source_variable.strip())
+    )
+    if header_rules > 1 and response:
+        header_index = _header_index(response.get("headers") or {})
+    return [run_extract(r, response, variables, db_rows, header_index) for r in rules]
@@ -1,5 +1,6 @@
 """JSON 报告 — 将执行结果输出为 JSON 字符串（RPT-001～RPT-004）"""
 
+import json
 from typing import Any
 
 from apirun.result.models import ExecutionResult
@@ -15,8 +16,6 @@ def to_json(
     - ensure_ascii=False 支持中文
     - 支持单结果、dict 或批量 list[dict]
     """
-    import json
-
     if isinstance(result, ExecutionResult):
         data = result.model_dump()
     else:
@@ -36,8 +35,6 @@ def to_json_engine_error(
     """
     引擎级异常时的 JSON 输出（RPT-004）：status=error + error 对象。
     """
-    import json
-
     data = {
         "execution_id": execution_id,
         "scenario_id": scenario_id,
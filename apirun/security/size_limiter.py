@@ -1,5 +1,6 @@
 """大小限制器"""
 
+import logging
 
 from apirun.errors import ENGINE_INTERNAL_ERROR, EngineError
 
@@ -22,8 +23,6 @@ class SizeLimiter:
             try:
                 size = int(content_length)
                 if size > max_size:
-                    import logging
-
                     logging.warning(f"响应体过大: {size} 字节")
                     return {
                         **response,
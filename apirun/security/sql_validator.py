@@ -2,6 +2,8 @@
 
 import re
 
+from apirun.errors import DB_QUERY_ERROR, EngineError
+
 
 class SQLValidator:
     """SQL 安全验证器"""
@@ -16,14 +18,16 @@ class SQLValidator:
         (r"exec\s*\(", "动态执行"),
     ]
 
+    # 模块加载时预编译，validate 中直接 search，免去每次查 re 模块缓存
+    _COMPILED_PATTERNS: list[tuple[re.Pattern[str], str, str]] = [
+        (re.compile(pattern, re.IGNORECASE), pattern, description)
+        for pattern, description in DANGEROUS_PATTERNS
+    ]
+
     MAX_SQL_LENGTH = 10000
 
     def validate(self, sql: str) -> None:
         """验证 SQL 安全性"""
-        from apirun.errors import DB_QUERY_ERROR, EngineError
-
-        sql_upper = sql.upper()
-
         if len(sql) > self.MAX_SQL_LENGTH:
             raise EngineError(
                 DB_QUERY_ERROR,
@@ -31,8 +35,9 @@ class SQLValidator:
                 detail=f"长度 {len(sql)} 超过限制 {self.MAX_SQL_LENGTH}",
             )
 
-        for pattern, description in self.DANGEROUS_PATTERNS:
-            if re.search(pattern, sql_upper, re.IGNORECASE):
+        sql_upper = sql.upper()
+        for regex, pattern, description in self._COMPILED_PATTERNS:
+            if regex.search(sql_upper):
                 raise EngineError(
                     DB_QUERY_ERROR,
                     f"SQL 安全检查失败: {description}",
@@ -0,0 +1,51 @@
+"""JSONPath 表达式缓存 — 相同表达式只解析一次，供断言与提取共用"""
+
+import re
+from functools import lru_cache
+from typing import Any
+
+from jsonpath_ng import JSONPath
+from jsonpath_ng import parse as jsonpath_parse
+
+# 纯点号路径（$.a.b.c）：无通配、下标与过滤，可直接逐层取 dict 值
+_SIMPLE_PATH_PATTERN = re.compile(r"\$(?:\.[A-Za-z_][A-Za-z0-9_]*)+")
+# jsonpath_ng 词法保留字，作字段名时解析行为与普通字段不同，交给解析器处理
+_RESERVED_WORDS = frozenset({"where", "wherenot"})
+
+
+@lru_cache(maxsize=1024)
+def compile_jsonpath(expression: str) -> JSONPath:
+    """解析 JSONPath 表达式并缓存解析结果。
+
+    jsonpath_ng 的 parse 每次都要经过词法/语法分析，远比 find 本身昂贵；
+    解析后的表达式对象只读，可在多次 find 间安全复用。解析失败时抛出原异常且不缓存。
+    """
+    return jsonpath_parse(expression)
+
+
+@lru_cache(maxsize=1024)
+def _simple_path_keys(expression: str) -> tuple[str, ...] | None:
+    """纯点号路径返回逐层字段名，其余表达式返回 None。"""
+    if not _SIMPLE_PATH_PATTERN.fullmatch(expression):
+        return None
+    keys = tuple(expression[2:].split("."))
+    if _RESERVED_WORDS.intersection(keys):
+        return None
+    return keys
+
+
+def find_values(data: Any, expression: str) -> list[Any]:
+    """按 JSONPath 查找全部匹配值（无匹配返回空列表）。
+
+    $.a.b.c 形式的纯点号路径直接逐层取 dict 值，结果与 jsonpath_ng 一致；
+    其余表达式使用缓存的解析结果执行 find。表达式非法时抛出 jsonpath_ng 的原异常。
+    """
+    keys = _simple_path_keys(expression)
+    if keys is None:
+        return [m.value for m in compile_jsonpath(expression).find(data)]
+    node = data
+    for key in keys:
+        if not isinstance(node, dict) or key not in node:
+            return []
+        node = node[key]
+    return [node]
@@ -7,6 +7,8 @@ import threading
 from collections.abc import Callable
 from typing import Any
 
+from apirun.errors import EngineError
+
 logger = logging.getLogger("sisyphus")
 
 DEFAULT_STEP_TIMEOUT = 300  # 默认步骤超时：5 分钟
@@ -57,8 +59,6 @@ def execute_with_timeout(
         # 超时了，线程仍在运行
         logger.warning(f"函数执行超时: {func.__name__}, 超时时间: {timeout}秒")
         if timeout_error:
-            from apirun.errors import EngineError
-
             error_code, error_message = timeout_error
             raise EngineError(
                 error_code,
@@ -2,9 +2,6 @@
 
 from typing import Any
 
-# 优先级从高到低：data_driven > extracted > scenario > environment > global_params
-_LAYER_ORDER = ("data_driven", "extracted", "scenario", "environment", "global_params")
-
 
 class VariablePool:
     """
@@ -13,7 +10,14 @@ class VariablePool:
     scope=global 写入 extracted 层，scope=environment 写入 environment 层（VAR-011）。
     """
 
-    __slots__ = ("_data_driven", "_extracted", "_scenario", "_environment", "_global_params")
+    __slots__ = (
+        "_data_driven",
+        "_extracted",
+        "_scenario",
+        "_environment",
+        "_global_params",
+        "_merged",
+    )
 
     def __init__(self) -> None:
         self._data_driven: dict[str, Any] = {}
@@ -21,11 +25,22 @@ class VariablePool:
         self._scenario: dict[str, Any] = {}
         self._environment: dict[str, Any] = {}
         self._global_params: dict[str, Any] = {}
+        # as_dict 的合并结果缓存；任何写入都会置空，下次 as_dict 时重建
+        self._merged: dict[str, Any] | None = None
+
+    def _layers(self) -> tuple[dict[str, Any], ...]:
+        """按优先级从高到低返回各层字典（层级顺序的唯一定义处）。"""
+        return (
+            self._data_driven,
+            self._extracted,
+            self._scenario,
+            self._environment,
+            self._global_params,
+        )
 
     def get(self, key: str) -> Any:
         """按优先级查找，先找到先返回。"""
-        for layer_name in _LAYER_ORDER:
-            layer = getattr(self, f"_{layer_name}")
+        for layer in self._layers():
             if key in layer:
                 return layer[key]
         raise KeyError(key)
@@ -47,31 +62,40 @@ class VariablePool:
             self._environment[key] = value
         else:
             self._extracted[key] = value
+        self._merged = None
 
     def set_scenario(self, variables: dict[str, Any] | None) -> None:
         """初始化/覆盖 scenario 层（config.variables）。"""
         self._scenario = dict(variables or {})
+        self._merged = None
 
     def set_environment(self, variables: dict[str, Any] | None) -> None:
         """初始化/覆盖 environment 层（config.environment.variables）。"""
         self._environment = dict(variables or {})
+        self._merged = None
 
     def set_data_driven(self, variables: dict[str, Any] | None) -> None:
         """注入数据驱动变量（单轮参数），优先级最高。"""
         self._data_driven = dict(variables or {})
+        self._merged = None
 
     def set_global_params(self, variables: dict[str, Any] | None) -> None:
         """初始化 global_params 层，优先级最低。"""
         self._global_params = dict(variables or {})
+        self._merged = None
 
     def as_dict(self) -> dict[str, Any]:
-        """合并为单字典，供 render_template 使用；高优先级覆盖低优先级。"""
-        out: dict[str, Any] = {}
-        for layer_name in reversed(_LAYER_ORDER):
-            layer = getattr(self, f"_{layer_name}")
-            out.update(layer)
-        return out
+        """合并为单字典，供 render_template 使用；高优先级覆盖低优先级。
+
+        变量未变化时返回同一个缓存字典，调用方只读不写。
+        """
+        if self._merged is None:
+            out: dict[str, Any] = {}
+            for layer in reversed(self._layers()):
+                out.update(layer)
+            self._merged = out
+        return self._merged
 
     def snapshot(self) -> dict[str, Any]:
-        """当前可见变量快照（与 as_dict 一致），用于结果输出。"""
-        return self.as_dict()
+        """当前可见变量快照（与 as_dict 内容一致的独立副本），用于结果输出。"""
+        return dict(self.as_dict())
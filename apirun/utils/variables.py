@@ -4,12 +4,14 @@
 - 递归渲染 dict / list / str 结构中的变量引用
 - 变量优先从 variables 字典中读取
 - 内置函数与全局参数函数: {{func(...)}} 或 {{方法名}}（VAR-009）
+- 模板解析结果按字符串缓存，重复渲染同一模板时跳过正则扫描
 """
 
 from __future__ import annotations
 
 import re
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
 from apirun.utils.functions import BUILTIN_FUNCTIONS
@@ -37,30 +39,70 @@ def _parse_func_args(args_part: str) -> list[Any]:
         token = raw.strip()
         if not token:
             continue
-        if (token.startswith("'") and token.endswith("'")) or (
-            token.startswith('"') and token.endswith('"')
-        ):
+        first = token[0]
+        if len(token) >= 2 and first == token[-1] and first in "'\"":
             args.append(token[1:-1])
-        else:
+        elif first.isdigit() or first in "+-":
+            # 仅数字开头的参数才尝试 int，裸标识符无需走异常路径
             try:
                 args.append(int(token))
             except ValueError:
                 args.append(token)
+        else:
+            args.append(token)
     return args
 
 
+@lru_cache(maxsize=1024)
+def _parse_call(expr: str) -> tuple[str, tuple[Any, ...]]:
+    """将函数表达式解析为 (函数名, 参数元组)；参数均为字面量，解析结果按表达式缓存。"""
+    name, _, args_part = expr.partition("(")
+    return name.strip(), tuple(_parse_func_args(args_part.rstrip(")")))
+
+
 def _eval_function(expr: str) -> Any:
     """解析并执行函数表达式：先内置函数，再全局参数函数（VAR-009）。"""
-    name, _, args_part = expr.partition("(")
-    name = name.strip()
-    args_part = args_part.rstrip(")")
+    name, args = _parse_call(expr)
+    # 函数按名称实时查找，注册/覆盖全局参数函数后立即生效
     func = BUILTIN_FUNCTIONS.get(name) or GLOBAL_PARAM_FUNCTIONS.get(name)
     if not func:
         raise VariableRenderError(f"未知函数: {name}")
-    args = _parse_func_args(args_part)
     return func(*args)
 
 
+@lru_cache(maxsize=4096)
+def _compile_template(template: str) -> tuple[str | None, tuple[str, ...]]:
+    """将模板字符串预解析为 (整体表达式, 片段序列)，同一模板只解析一次。
+
+    - 整体表达式: 字符串整体就是一个 {{...}} 时为其表达式，否则为 None
+    - 片段序列: 字面量与表达式交替排列，偶数位为字面量、奇数位为表达式
+    """
+    full_match = _TEMPLATE_PATTERN.fullmatch(template.strip())
+    if full_match:
+        return full_match.group("expr").strip(), ()
+
+    parts: list[str] = []
+    last = 0
+    for match in _TEMPLATE_PATTERN.finditer(template):
+        parts.append(template[last : match.start()])
+        parts.append(match.group("expr").strip())
+        last = match.end()
+    parts.append(template[last:])
+    return None, tuple(parts)
+
+
+def _resolve_expr(expr: str, variables: dict[str, Any]) -> Any:
+    """求值单个 {{...}} 表达式：变量名或函数调用。"""
+    # 仅变量名：先 variables，再全局参数函数无参调用（VAR-009）
+    if "(" not in expr and ")" not in expr:
+        if expr in variables:
+            return variables[expr]
+        if expr in GLOBAL_PARAM_FUNCTIONS:
+            return GLOBAL_PARAM_FUNCTIONS[expr]()
+        raise VariableRenderError(f"变量或函数未找到: {expr}")
+    return _eval_function(expr)
+
+
 def _render_string(template: str, variables: dict[str, Any]) -> Any:
     """渲染单个字符串模板。
 
@@ -70,31 +112,23 @@ def _render_string(template: str, variables: dict[str, Any]) -> Any:
 
     其他情况按普通模板字符串处理, 返回 str。
     """
+    # 不含模板标记的字符串（静态请求定义中的绝大多数字段）直接原样返回
+    if "{{" not in template:
+        return template
 
-    def _resolve_expr(expr: str) -> Any:
-        # 仅变量名：先 variables，再全局参数函数无参调用（VAR-009）
-        if "(" not in expr and ")" not in expr:
-            if expr in variables:
-                return variables[expr]
-            if expr in GLOBAL_PARAM_FUNCTIONS:
-                return GLOBAL_PARAM_FUNCTIONS[expr]()
-            raise VariableRenderError(f"变量或函数未找到: {expr}")
-        return _eval_function(expr)
-
-    def replace(match: re.Match[str]) -> str:
-        expr = match.group("expr").strip()
-        return str(_resolve_expr(expr))
-
+    full_expr, parts = _compile_template(template)
     # 整个字符串正好是一个 {{...}} 表达式时, 尝试返回原始类型
-    full_match = _TEMPLATE_PATTERN.fullmatch(template.strip())
-    if full_match:
-        expr = full_match.group("expr").strip()
-        return _resolve_expr(expr)
+    if full_expr is not None:
+        return _resolve_expr(full_expr, variables)
+
+    # 形如 "{{" 但不构成完整表达式时同样原样返回
+    if len(parts) == 1:
+        return template
 
-    try:
-        return _TEMPLATE_PATTERN.sub(replace, template)
-    except VariableRenderError:
-        raise
+    chunks = list(parts)
+    for i in range(1, len(chunks), 2):
+        chunks[i] = str(_resolve_expr(chunks[i], variables))
+    return "".join(chunks)
 
 
 def render_value(value: Any, variables: dict[str, Any]) -> Any:
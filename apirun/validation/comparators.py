@@ -3,6 +3,7 @@
 import logging
 import re
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
 from apirun.security import regex_validator
@@ -103,6 +104,13 @@ def compare_endswith(actual: Any, expected: Any) -> bool:
     return _ensure_str(actual).endswith(_ensure_str(expected))
 
 
+@lru_cache(maxsize=512)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """ReDoS 校验并编译正则；通过校验的模式按字符串缓存，同一模式只校验、编译一次。"""
+    regex_validator.validate(pattern)
+    return re.compile(pattern)
+
+
 def compare_matches(actual: Any, expected: Any) -> bool:
     """正则匹配（VLD-011）- 带 ReDoS 防护"""
     if actual is None or expected is None:
@@ -110,18 +118,15 @@ def compare_matches(actual: Any, expected: Any) -> bool:
 
     pattern = str(expected)
 
-    # ReDoS 安全验证
+    # ReDoS 安全验证（校验失败的模式不进缓存，每次均重新校验并告警）
     try:
-        regex_validator.validate(pattern)
+        compiled = _compile_pattern(pattern)
     except Exception as e:
         logger.warning(f"正则表达式验证失败: {pattern}, 错误: {e}")
         return False
 
     try:
-        return re.search(pattern, _ensure_str(actual)) is not None
-    except re.error as e:
-        logger.debug(f"正则匹配失败: pattern={pattern}, 错误: {e}")
-        return False
+        return compiled.search(_ensure_str(actual)) is not None
     except Exception:
         logger.error(f"正则匹配发生未预期错误: pattern={pattern}", exc_info=True)
         return False
@@ -2,9 +2,8 @@
 
 from typing import Any
 
-from jsonpath_ng import parse as jsonpath_parse
-
 from apirun.result.models import AssertionResult
+from apirun.utils.jsonpath import find_values
 from apirun.utils.variables import render_template
 
 from .comparators import compare
@@ -15,13 +14,12 @@ def _extract_json(body: Any, expression: str) -> Any:
     if body is None:
         return None
     try:
-        expr = jsonpath_parse(expression)
-        matches = expr.find(body)
-        if not matches:
+        values = find_values(body, expression)
+        if not values:
             return None
-        if len(matches) == 1:
-            return matches[0].value
-        return [m.value for m in matches]
+        if len(values) == 1:
+            return values[0]
+        return values
     except Exception:
         return None
 
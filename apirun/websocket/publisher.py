@@ -1,5 +1,6 @@
 """事件发布器 — 场景/步骤开始与完成事件推送（WS-001～WS-003）"""
 
+import json
 import logging
 import time
 from datetime import UTC, datetime
@@ -122,8 +123,6 @@ class WsPublisher:
         }
 
         try:
-            import json as _json
-
             # 可选依赖检查
             try:
                 import websocket  # noqa: F401
@@ -138,7 +137,7 @@ class WsPublisher:
 
             try:
                 # 发送消息
-                self._ws.send(_json.dumps(payload, ensure_ascii=False))
+                self._ws.send(json.dumps(payload, ensure_ascii=False))
                 logger.debug(f"WebSocket 事件推送成功: {event_type}")
             except Exception as e:
                 # 发送失败，可能是连接断开，尝试重连
@@ -148,7 +147,7 @@ class WsPublisher:
                 if self._ws is not None:
                     # 重连成功，重试发送
                     try:
-                        self._ws.send(_json.dumps(payload, ensure_ascii=False))
+                        self._ws.send(json.dumps(payload, ensure_ascii=False))
                         logger.info(f"WebSocket 重连后发送成功: {event_type}")
                     except Exception as retry_error:
                         logger.error(f"WebSocket 重连后发送仍失败: {retry_error}")
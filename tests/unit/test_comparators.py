@@ -1,7 +1,10 @@
 """断言比较器单元测试（VLD-001～VLD-017 / TST-025）"""
 
+from unittest.mock import patch
+
 from apirun.validation.comparators import (
     COMPARATORS,
+    _compile_pattern,
     compare,
     compare_contains,
     compare_endswith,
@@ -63,6 +66,19 @@ def test_matches():
     assert compare_matches("abc", r"^[0-9]+$") is False
 
 
+def test_matches_validates_each_pattern_once():
+    _compile_pattern.cache_clear()
+    with patch("apirun.validation.comparators.regex_validator.validate") as validate:
+        assert compare_matches("a1", r"[0-9]") is True
+        assert compare_matches("b", r"[0-9]") is False
+    validate.assert_called_once_with(r"[0-9]")
+
+
+def test_matches_rejects_unsafe_or_invalid_pattern():
+    assert compare_matches("aaaa", r"([a-z]+)*+") is False
+    assert compare_matches("abc", "(") is False
+
+
 def test_type_match():
     assert compare_type_match(1, "int") is True
     assert compare_type_match("x", "str") is True
@@ -29,6 +29,7 @@ def test_config_default_values():
     assert config.STEP_TIMEOUT == 300
     assert config.DB_POOL_SIZE == 5
     assert config.MAX_WORKERS == 4
+    assert config.HTTP_REUSE_SESSION is True
 
     # 日志配置
     assert config.LOG_LEVEL == "INFO"
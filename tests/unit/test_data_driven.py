@@ -73,3 +73,21 @@ def test_get_parameter_sets_no_ddts():
     enabled, _, _, params = get_parameter_sets(case)
     assert enabled is False
     assert params == []
+
+
+def test_run_data_driven_counts_failed_runs(case_with_ddts):
+    """未通过的轮次计入 failed_runs，pass_rate 按轮次计算（DDT-007）"""
+
+    def fake_run(case: CaseModel, params: dict):
+        return ExecutionResult(
+            status="passed" if params["user"] == "a" else "failed",
+            duration=10,
+            summary=ExecutionSummary(total_steps=1),
+            steps=[],
+        )
+
+    ddr, _ = run_data_driven(case_with_ddts, fake_run)
+    assert ddr.passed_runs == 1
+    assert ddr.failed_runs == 1
+    assert ddr.pass_rate == 50.0
+    assert ddr.model_dump()["runs"][1]["status"] == "failed"
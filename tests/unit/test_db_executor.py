@@ -1,10 +1,35 @@
 """数据库执行器单元测试（DB-001～DB-011 / TST-028）"""
 
-from unittest.mock import patch
+from contextlib import nullcontext
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 from apirun.core.models import DbParams
-from apirun.errors import DB_DATASOURCE_NOT_FOUND
-from apirun.executor.db import execute_db_step, execute_db_step_safe
+from apirun.errors import (
+    DB_CONNECTION_ERROR,
+    DB_DATASOURCE_NOT_FOUND,
+    DB_QUERY_ERROR,
+    VARIABLE_RENDER_ERROR,
+    EngineError,
+)
+from apirun.executor.db import (
+    ResolvedDataSource,
+    _fetch_rows,
+    _is_connection_error,
+    _resolve_datasource,
+    _validate_sql,
+    close_db_pools,
+    execute_db_statements,
+    execute_db_step,
+    execute_db_step_safe,
+)
+
+
+def _fake_mysql(columns, rows):
+    """替换 mysql 驱动：不建立连接，直接返回给定结果集"""
+    run = MagicMock(return_value=(columns, rows))
+    return patch.dict("apirun.executor.db._DRIVERS", {"mysql": (nullcontext, run)})
 
 
 def test_datasource_not_found():
@@ -30,8 +55,7 @@ def test_datasource_from_variables():
             "driver": "mysql",
         },
     }
-    with patch("apirun.executor.db._execute_mysql") as m:
-        m.return_value = (["x"], [{"x": 1}])
+    with _fake_mysql(["x"], [{"x": 1}]):
         out = execute_db_step(params, variables=variables)
     assert out["error"] is None
     assert out["db_detail"]["row_count"] == 1
@@ -54,8 +78,7 @@ def test_sql_variable_replacement():
         },
         "id": 42,
     }
-    with patch("apirun.executor.db._execute_mysql") as m:
-        m.return_value = (["id"], [{"id": 42}])
+    with _fake_mysql(["id"], [{"id": 42}]):
         out = execute_db_step(params, variables=variables)
     assert out["error"] is None
     assert "42" in out["db_detail"]["sql_rendered"]
@@ -74,8 +97,7 @@ def test_db_detail_structure():
             "driver": "mysql",
         },
     }
-    with patch("apirun.executor.db._execute_mysql") as m:
-        m.return_value = (["a", "b"], [{"a": 1, "b": 2}])
+    with _fake_mysql(["a", "b"], [{"a": 1, "b": 2}]):
         out = execute_db_step(params, variables=variables)
     d = out["db_detail"]
     assert d["datasource"] == "db_main"
@@ -93,3 +115,189 @@ def test_execute_db_step_safe_catches_engine_error():
     out = execute_db_step_safe(params, variables={})
     assert "error" in out
     assert out["error"]["code"] == DB_DATASOURCE_NOT_FOUND
+
+
+def test_unsupported_driver_returns_connection_error():
+    """不支持的 driver 返回 DB_CONNECTION_ERROR"""
+    params = DbParams(datasource="db_main", sql="SELECT 1")
+    out = execute_db_step_safe(params, {"db_main": {"driver": "oracle"}})
+    assert out["error"]["code"] == DB_CONNECTION_ERROR
+    assert "oracle" in out["error"]["message"]
+
+
+def test_mysql_connection_reused_from_pool():
+    """同一数据源的多次查询复用连接池中的连接，归还前回滚未提交事务"""
+    conn = MagicMock()
+    cur = conn.cursor.return_value.__enter__.return_value
+    cur.description = (("x", None, None, None, None, None, None),)
+    cur.fetchmany.side_effect = [[{"x": 1}], [], [{"x": 1}], []]
+    cfg = {"host": "h", "port": 3306, "user": "u", "password": "p", "database": "d"}
+    params = DbParams(datasource="db_main", sql="SELECT 1 AS x")
+    close_db_pools()
+    try:
+        with patch("pymysql.connect", return_value=conn) as connect:
+            for _ in range(2):
+                out = execute_db_step(params, {"db_main": cfg})
+                assert out["rows"] == [{"x": 1}]
+        assert connect.call_count == 1
+        assert conn.rollback.call_count == 2
+        conn.ping.assert_called_once_with(reconnect=True)
+    finally:
+        close_db_pools()
+    conn.close.assert_called_once()
+
+
+def test_execute_db_statements_share_one_connection():
+    """前置/后置 SQL 批量执行只借出一次连接，单条失败回滚后继续执行（RUN-018/019）"""
+    conn = MagicMock()
+    cur = conn.cursor.return_value.__enter__.return_value
+    cur.description = None
+    cur.execute.side_effect = [None, RuntimeError("syntax error"), None]
+    cfg = {"host": "h", "user": "u", "password": "p", "database": "d", "driver": "mysql"}
+    close_db_pools()
+    try:
+        with patch("pymysql.connect", return_value=conn) as connect:
+            out = execute_db_statements(
+                "db_main",
+                ["DELETE FROM t WHERE id = {{id}}", "BAD SQL", "DELETE FROM t"],
+                {"db_main": cfg, "id": 7},
+            )
+        assert connect.call_count == 1
+    finally:
+        close_db_pools()
+    assert [o["error"] is None for o in out] == [True, False, True]
+    assert out[1]["error"]["code"] == DB_QUERY_ERROR
+    assert out[0]["db_detail"]["sql_rendered"] == "DELETE FROM t WHERE id = 7"
+    # 失败语句后回滚一次，归还连接池前再回滚一次
+    assert conn.rollback.call_count == 2
+
+
+def test_execute_db_statements_render_error_skips_only_that_statement():
+    """单条语句模板渲染失败只记该语句错误，后续语句照常执行"""
+    conn = MagicMock()
+    cur = conn.cursor.return_value.__enter__.return_value
+    cur.description = None
+    cfg = {"host": "h", "user": "u", "password": "p", "database": "d", "driver": "mysql"}
+    close_db_pools()
+    try:
+        with patch("pymysql.connect", return_value=conn):
+            out = execute_db_statements(
+                "db_main",
+                ["DELETE FROM a", "DELETE FROM t WHERE id = {{missing}}", "DELETE FROM b"],
+                {"db_main": cfg},
+            )
+    finally:
+        close_db_pools()
+    assert [o["error"] is None for o in out] == [True, False, True]
+    assert out[1]["error"]["code"] == VARIABLE_RENDER_ERROR
+    assert [c.args[0] for c in cur.execute.call_args_list] == ["DELETE FROM a", "DELETE FROM b"]
+
+
+def test_execute_db_statements_connect_failure():
+    """借出连接失败时每条语句都记为 DB_CONNECTION_ERROR"""
+    cfg = {"host": "h", "user": "u", "password": "p", "database": "d", "driver": "mysql"}
+    close_db_pools()
+    try:
+        with patch("pymysql.connect", side_effect=OSError("refused")):
+            out = execute_db_statements("db_main", ["SELECT 1", "SELECT 2"], {"db_main": cfg})
+    finally:
+        close_db_pools()
+    assert [o["error"]["code"] for o in out] == [DB_CONNECTION_ERROR] * 2
+    assert out[0]["error"]["message"] == "refused"
+
+
+def test_execute_db_statements_datasource_not_found():
+    """数据源未找到时每条语句都返回 DB_DATASOURCE_NOT_FOUND"""
+    out = execute_db_statements("missing", ["SELECT 1", "SELECT 2"], {})
+    assert [o["error"]["code"] for o in out] == [DB_DATASOURCE_NOT_FOUND] * 2
+
+
+def test_fetch_rows_reads_columns_from_description():
+    """列名取自 cursor.description，空结果也保留列名；无结果集语句返回空"""
+    cur = MagicMock()
+    cur.description = (("id",), ("name",))
+    cur.fetchmany.side_effect = [[{"id": 1, "name": "a"}, {"id": 2, "name": "b"}], []]
+    assert _fetch_rows(cur) == (["id", "name"], [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}])
+
+    cur = MagicMock()
+    cur.description = (("id",),)
+    cur.fetchmany.return_value = []
+    assert _fetch_rows(cur) == (["id"], [])
+
+    cur = MagicMock()
+    cur.description = None
+    assert _fetch_rows(cur) == ([], [])
+    cur.fetchmany.assert_not_called()
+
+
+def test_fetch_rows_duplicate_column_names_follow_row_keys():
+    """同名列（如 a.id, b.id）的 columns 与行 key 一致，而非 cursor.description 的重复列名"""
+    # pymysql DictCursor：第二个同名列改名为「表名.列名」
+    cur = MagicMock()
+    cur.description = (("id",), ("id",))
+    cur.fetchmany.side_effect = [[{"id": 1, "b.id": 2}], []]
+    assert _fetch_rows(cur) == (["id", "b.id"], [{"id": 1, "b.id": 2}])
+
+    # psycopg2 RealDictCursor：同名列合并为一个 key
+    cur = MagicMock()
+    cur.description = (("id",), ("id",))
+    cur.fetchmany.side_effect = [[{"id": 2}], []]
+    assert _fetch_rows(cur) == (["id"], [{"id": 2}])
+
+
+def test_connection_error_classified_by_exception_type():
+    """按异常类型区分 DB_CONNECTION_ERROR 与 DB_QUERY_ERROR"""
+    import psycopg2
+    import pymysql
+
+    assert _is_connection_error(pymysql.err.OperationalError(2003, "Can't connect"))
+    assert _is_connection_error(pymysql.err.InterfaceError(0, ""))
+    assert _is_connection_error(psycopg2.OperationalError("server closed"))
+    assert _is_connection_error(ConnectionRefusedError())
+    assert not _is_connection_error(pymysql.err.OperationalError(1054, "Unknown column"))
+    assert not _is_connection_error(pymysql.err.ProgrammingError(1064, "syntax"))
+    assert not _is_connection_error(RuntimeError("connection pool table missing"))
+    # psycopg2 的 OperationalError 子类多为查询级错误（语句超时、死锁等）
+    from psycopg2 import errors as pg_errors
+    from psycopg2.extensions import QueryCanceledError
+
+    assert not _is_connection_error(QueryCanceledError("canceling statement due to timeout"))
+    assert not _is_connection_error(pg_errors.QueryCanceled("statement timeout"))
+    assert not _is_connection_error(pg_errors.DeadlockDetected("deadlock detected"))
+    assert not _is_connection_error(pg_errors.DiskFull("no space left"))
+    # 服务端返回的错误按 SQLSTATE 分类：仅 08 类为连接错误
+    assert _is_connection_error(MagicMock(spec=psycopg2.OperationalError, pgcode="08006"))
+    assert not _is_connection_error(MagicMock(spec=psycopg2.OperationalError, pgcode="57014"))
+
+
+def test_validate_sql_caches_only_passing_statements():
+    """同一条 SQL 只做一次安全校验；校验失败的 SQL 每次都重新校验"""
+    from apirun.security import sql_validator
+
+    sql = "SELECT id FROM cache_probe WHERE id = 1"
+    bad = "SELECT * FROM cache_probe WHERE id = 1 OR 1=1"
+    with patch.object(sql_validator, "validate", wraps=sql_validator.validate) as validate:
+        _validate_sql(sql)
+        _validate_sql(sql)
+        for _ in range(2):
+            with pytest.raises(EngineError):
+                _validate_sql(bad)
+    assert [c.args[0] for c in validate.call_args_list] == [sql, bad, bad]
+
+
+def test_resolve_datasource_normalizes_config():
+    """数据源配置规范化为不可变结构：driver 小写、端口转 int、按 driver 填充默认端口"""
+    ds = _resolve_datasource("pg", {"pg": {"driver": "PostgreSQL", "host": "db", "user": "u"}})
+    assert ds == ResolvedDataSource(
+        driver="postgresql",
+        host="db",
+        port=5432,
+        user="u",
+        password="",
+        database="",
+        charset="utf8mb4",
+    )
+    assert _resolve_datasource("m", {"m": {"port": "3307"}}).port == 3307
+    with pytest.raises(EngineError) as exc:
+        _resolve_datasource("m", {"m": {"port": "abc"}})
+    assert exc.value.code == DB_CONNECTION_ERROR
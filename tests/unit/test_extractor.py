@@ -128,3 +128,41 @@ def test_run_extract_batch():
     results = run_extract_batch(rules, response=resp)
     assert len(results) == 2
     assert results[0].value == 1 and results[1].value == 2
+
+
+def test_extract_json_parses_expression_once():
+    """同一 JSONPath 多次提取只解析一次，非法表达式按提取失败处理"""
+    from apirun.utils.jsonpath import compile_jsonpath
+
+    resp = {"body": {"items": [{"id": 1}, {"id": 2}]}, "headers": {}, "cookies": {}}
+    rule = ExtractRule(name="ids", type="json", expression="$.items[*].id", scope="global")
+    compile_jsonpath.cache_clear()
+    for _ in range(3):
+        assert run_extract(rule, response=resp).value == [1, 2]
+    info = compile_jsonpath.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+    bad = ExtractRule(name="bad", type="json", expression="$.items[", scope="global")
+    assert run_extract(bad, response=resp).status == "failed"
+
+
+def test_run_extract_batch_header_index_matches_scan():
+    """批量 header 提取走小写索引，结果与逐条扫描一致（含 source_variable 数据源）"""
+    resp = {"headers": {"Content-Type": "application/json", "X-Trace": "t1", "x-trace": "t2"}}
+    other = {"headers": {"X-Trace": "other"}}
+    rules = [
+        ExtractRule(name="ct", type="header", expression=" content-type ", scope="global"),
+        ExtractRule(name="tr", type="header", expression="X-TRACE", scope="global"),
+        ExtractRule(name="miss", type="header", expression="X-None", scope="global"),
+        ExtractRule(
+            name="src",
+            type="header",
+            expression="x-trace",
+            scope="global",
+            source_variable="other",
+        ),
+    ]
+    batch = run_extract_batch(rules, response=resp, variables={"other": other})
+    single = [run_extract(r, response=resp, variables={"other": other}) for r in rules]
+    assert [r.value for r in batch] == [r.value for r in single]
+    assert [r.value for r in batch] == ["application/json", "t1", None, "other"]
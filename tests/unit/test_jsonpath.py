@@ -0,0 +1,51 @@
+"""JSONPath 缓存与纯点号路径快速通道单元测试"""
+
+import pytest
+from jsonpath_ng import parse as jsonpath_parse
+
+from apirun.utils.jsonpath import compile_jsonpath, find_values
+
+BODY = {
+    "data": {"user": {"id": 1, "name": None}, "items": [{"id": 1}, {"id": 2}]},
+    "id": 9,
+    "where": {"x": 1},
+    "text": "plain",
+}
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "$.data.user.id",
+        "$.data.user.name",
+        "$.data.missing",
+        "$.data.items",
+        "$.data.items.id",
+        "$.text.length",
+        "$.id",
+        "$.data.items[*].id",
+        "$.data.items[0].id",
+        "$..id",
+    ],
+)
+def test_find_values_matches_jsonpath_ng(expression):
+    """纯点号快速通道与 jsonpath_ng 的查找结果一致"""
+    expected = [m.value for m in jsonpath_parse(expression).find(BODY)]
+    assert find_values(BODY, expression) == expected
+
+
+def test_find_values_reserved_word_falls_back_to_parser():
+    """字段名是 jsonpath_ng 保留字时走解析器，保持原有报错行为"""
+    with pytest.raises(Exception):
+        find_values(BODY, "$.where.x")
+
+
+def test_find_values_non_dict_root():
+    """根节点不是 dict 时纯点号路径无匹配"""
+    assert find_values([{"id": 1}], "$.id") == []
+    assert find_values("text", "$.id") == []
+
+
+def test_compile_jsonpath_cached():
+    """同一表达式返回同一个解析结果对象"""
+    assert compile_jsonpath("$.a[0]") is compile_jsonpath("$.a[0]")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from typing import Any
 
 from apirun.core.models import RequestStepParams
@@ -38,7 +39,9 @@ def test_execute_request_step_renders_variables_in_url(monkeypatch):
         called["kwargs"] = kwargs
         return _DummyResponse(url)
 
-    monkeypatch.setattr("apirun.executor.request.requests.request", fake_request)
+    monkeypatch.setattr(
+        "apirun.executor.request._get_session", lambda: SimpleNamespace(request=fake_request)
+    )
 
     params = RequestStepParams(method="GET", url="/users/{{user_id}}")
     result = execute_request_step(
@@ -50,6 +53,36 @@ def test_execute_request_step_renders_variables_in_url(monkeypatch):
     assert result["body"] == "ok"
 
 
+def test_execute_request_step_renders_all_request_fields(monkeypatch):
+    """headers/params/json/cookies 一次渲染，未设置的字段保持 None"""
+    called: dict[str, Any] = {}
+
+    def fake_request(method: str, url: str, **kwargs: Any):
+        called.update(kwargs)
+        return _DummyResponse(url)
+
+    monkeypatch.setattr(
+        "apirun.executor.request._get_session", lambda: SimpleNamespace(request=fake_request)
+    )
+
+    params = RequestStepParams(
+        method="POST",
+        url="https://api.example.com/orders",
+        headers={"Authorization": "Bearer {{token}}"},
+        params={"page": "{{page}}"},
+        json_body={"ids": ["{{order_id}}"]},
+        cookies={"sid": "{{token}}"},
+    )
+    execute_request_step(params, variables={"token": "t-1", "page": 2, "order_id": 9})
+
+    assert called["headers"] == {"Authorization": "Bearer t-1"}
+    assert called["params"] == {"page": 2}
+    assert called["json"] == {"ids": [9]}
+    assert called["cookies"] == {"sid": "t-1"}
+    assert called["data"] is None
+    assert called["files"] is None
+
+
 def test_execute_request_step_minio_files_download(monkeypatch, tmp_path):
     """当 files 中包含 MinIO 路径时，应自动下载到临时文件并作为文件上传。"""
     downloaded_paths: list[str] = []
@@ -74,7 +107,9 @@ def test_execute_request_step_minio_files_download(monkeypatch, tmp_path):
         called["kwargs"] = kwargs
         return _DummyResponse(url)
 
-    monkeypatch.setattr("apirun.executor.request.requests.request", fake_request)
+    monkeypatch.setattr(
+        "apirun.executor.request._get_session", lambda: SimpleNamespace(request=fake_request)
+    )
 
     params = RequestStepParams(
         method="POST",
@@ -94,3 +129,167 @@ def test_execute_request_step_minio_files_download(monkeypatch, tmp_path):
     # (filename, fileobj)
     assert isinstance(file_tuple, tuple)
     assert file_tuple[0] == "minio_file.txt"
+
+
+def test_minio_file_shared_by_fields_downloaded_once(monkeypatch, tmp_path):
+    """同一 MinIO 路径被多个字段引用时只下载一次，请求结束后删除临时文件。"""
+    downloads: list[str] = []
+    temp_file = tmp_path / "shared.txt"
+
+    def fake_download_to_temp(minio_path: str):
+        downloads.append(minio_path)
+        temp_file.write_text("shared", encoding="utf-8")
+        return temp_file
+
+    monkeypatch.setattr("apirun.executor.request.download_to_temp", fake_download_to_temp)
+    monkeypatch.setattr(
+        "apirun.executor.request._get_session",
+        lambda: SimpleNamespace(request=lambda method, url, **kw: _DummyResponse(url)),
+    )
+
+    params = RequestStepParams(
+        method="POST",
+        url="https://api.example.com/upload",
+        files={"a": "minio://bucket/shared.txt", "b": "minio://bucket/shared.txt"},
+    )
+    execute_request_step(params)
+
+    assert downloads == ["minio://bucket/shared.txt"]
+    assert not temp_file.exists()
+
+
+def test_session_reused_within_thread_and_isolated_across_threads():
+    """同一线程复用 Session（keep-alive），不同线程各自独立。"""
+    import threading
+
+    from apirun.executor.request import _get_session
+
+    main_session = _get_session()
+    assert _get_session() is main_session
+
+    other: list[Any] = []
+    t = threading.Thread(target=lambda: other.append(_get_session()))
+    t.start()
+    t.join()
+    assert other[0] is not main_session
+
+
+def test_session_does_not_persist_response_cookies():
+    """Session 不保存响应 Cookie，步骤之间不会隐式携带上一响应的 Cookie。"""
+    from requests.cookies import create_cookie
+
+    from apirun.executor.request import _get_session
+
+    jar = _get_session().cookies
+    policy = jar.get_policy()
+    cookie = create_cookie("SESSIONID", "abc", domain="api.example.com")
+    request = SimpleNamespace(
+        get_full_url=lambda: "https://api.example.com/login",
+        get_host=lambda: "api.example.com",
+        get_origin_req_host=lambda: "api.example.com",
+        unverifiable=False,
+        type="https",
+    )
+    assert policy.set_ok(cookie, request) is False
+
+
+class _JsonResponse(_DummyResponse):
+    def __init__(self, content: bytes) -> None:
+        super().__init__("")
+        self._content = content
+        self._text = content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        import json
+
+        return json.loads(self._content)
+
+
+def test_parse_body_json_and_text_fallback(monkeypatch):
+    """JSON 响应体解析为对象，非 JSON 回退为文本；未安装 orjson 时结果一致。"""
+    from apirun.executor import request as request_module
+
+    for orjson_module in (request_module._orjson, None):
+        monkeypatch.setattr(request_module, "_orjson", orjson_module)
+        assert request_module._parse_body(_JsonResponse(b'{"a": [1, 2]}')) == {"a": [1, 2]}
+        assert request_module._parse_body(_JsonResponse(b"<html>ok</html>")) == "<html>ok</html>"
+
+
+def test_parse_body_uses_simdjson_for_large_bodies(monkeypatch):
+    """大响应体交给 simdjson 解析，小响应体与解析失败时走原有路径。"""
+    from apirun.executor import request as request_module
+
+    parsed: list[bytes] = []
+
+    def fake_loads(content: bytes) -> Any:
+        parsed.append(content)
+        if not content.startswith(b"{"):
+            raise ValueError("not json")
+        return {"big": True}
+
+    monkeypatch.setattr(request_module, "_simdjson", SimpleNamespace(loads=fake_loads))
+    monkeypatch.setattr(request_module, "_SIMDJSON_MIN_SIZE", 8)
+
+    assert request_module._parse_body(_JsonResponse(b'{"a": 1}')) == {"big": True}
+    assert request_module._parse_body(_JsonResponse(b"{}")) == {}
+    assert request_module._parse_body(_JsonResponse(b"<html>ok</html>")) == "<html>ok</html>"
+    assert parsed == [b'{"a": 1}', b"<html>ok</html>"]
+
+
+def test_parse_body_falls_back_to_resp_json_after_strict_rejection(monkeypatch):
+    """严格解析器拒绝后仍交给 resp.json()（NaN、BOM、其他编码）；首字节不可能开始 JSON 时直接返回文本。"""
+    import json
+    import math
+
+    from apirun.executor import request as request_module
+
+    class _CountingResponse(_JsonResponse):
+        json_calls = 0
+
+        def json(self) -> Any:
+            type(self).json_calls += 1
+            return super().json()
+
+    def strict_loads(content: bytes) -> Any:
+        # 模拟 orjson：只接受无 BOM 的 UTF-8 与标准 JSON（拒绝 NaN / Infinity）
+        return json.loads(content.decode("utf-8"), parse_constant=_reject_constant)
+
+    def _reject_constant(name: str) -> Any:
+        raise ValueError(name)
+
+    monkeypatch.setattr(request_module, "_orjson", SimpleNamespace(loads=strict_loads))
+    monkeypatch.setattr(request_module, "_simdjson", None)
+
+    assert request_module._parse_body(_CountingResponse(b"<html>ok</html>")) == "<html>ok</html>"
+    assert _CountingResponse.json_calls == 0
+
+    nan_body = request_module._parse_body(_CountingResponse(b'  {"v": NaN}'))
+    assert math.isnan(nan_body["v"])
+    assert _CountingResponse.json_calls == 1
+
+    monkeypatch.setattr(_JsonResponse, "json", lambda self: {"a": 1})
+    assert request_module._parse_body(_CountingResponse(b"\xef\xbb\xbf" + b'{"a": 1}')) == {"a": 1}
+    assert request_module._parse_body(_CountingResponse(b"\xff\xfe{\x00}\x00")) == {"a": 1}
+    assert _CountingResponse.json_calls == 3
+
+
+def test_parse_body_keeps_big_integers_exact(monkeypatch):
+    """超过 64 位的整数不交给 orjson / simdjson，结果与 resp.json() 一致（整数精确）"""
+    from apirun.executor import request as request_module
+
+    big = b'{"id": 123456789012345678901234567890}'
+    # 模拟严格解析器把大整数转成 float 的行为
+    lossy = SimpleNamespace(loads=lambda content: {"lossy": True})
+    for orjson_module in (request_module._orjson, lossy):
+        monkeypatch.setattr(request_module, "_orjson", orjson_module)
+        assert request_module._parse_body(_JsonResponse(big)) == {
+            "id": 123456789012345678901234567890
+        }
+
+    monkeypatch.setattr(request_module, "_simdjson", lossy)
+    monkeypatch.setattr(request_module, "_SIMDJSON_MIN_SIZE", 8)
+    assert request_module._parse_body(_JsonResponse(big)) == {"id": 123456789012345678901234567890}
+    # 不超过 19 位的整数仍走严格解析器
+    assert request_module._parse_body(_JsonResponse(b'{"id": 1234567890123456789}')) == {
+        "lossy": True
+    }
@@ -6,7 +6,9 @@ from pathlib import Path
 
 import pytest
 
-from apirun.core.runner import load_case, run_case
+from apirun.core.runner import _apply_extract_results, load_case, run_case
+from apirun.result.models import ExtractResult
+from apirun.utils.variable_pool import VariablePool
 
 
 def _minimal_yaml(content: str) -> Path:
@@ -190,3 +192,26 @@ teststeps:
         assert step.request_detail.url == "https://api.from.environment/ping"
     finally:
         case_path.unlink(missing_ok=True)
+
+
+def test_apply_extract_results_writes_successes_and_flags_failures():
+    """提取结果一次遍历：成功值按 scope 写入变量池，失败项只标记不写入"""
+    pool = VariablePool()
+    results = [
+        ExtractResult(name="token", type="json", expression="$.t", value="abc", status="success"),
+        ExtractResult(
+            name="region",
+            type="header",
+            expression="X-Region",
+            scope="environment",
+            value="cn",
+            status="success",
+        ),
+        ExtractResult(name="missing", type="json", expression="$.m", status="failed"),
+    ]
+    dumped, any_failed = _apply_extract_results(pool, results)
+    assert any_failed is True
+    assert [d["name"] for d in dumped] == ["token", "region", "missing"]
+    assert pool.get("token") == "abc"
+    assert pool._environment["region"] == "cn"
+    assert pool.get_or_none("missing") is None
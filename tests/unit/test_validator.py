@@ -114,3 +114,20 @@ def test_db_result_expression():
     r = run_assertion("db_result", "eq", "a@b.com", "$[0].email", None, db_rows=db_rows)
     assert r.status == "passed"
     assert r.actual == "a@b.com"
+
+
+def test_json_expression_parsed_once():
+    """同一 JSONPath 表达式只解析一次；非法表达式不缓存且断言失败"""
+    from apirun.utils.jsonpath import compile_jsonpath
+
+    resp = {"status_code": 200, "headers": {}, "body": {"data": [{"id": 7}]}, "cookies": {}}
+    compile_jsonpath.cache_clear()
+    for _ in range(3):
+        r = run_assertion("json", "eq", 7, "$.data[0].id", None, response=resp)
+        assert r.status == "passed"
+    info = compile_jsonpath.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+    r = run_assertion("json", "eq", 7, "$.data[", None, response=resp)
+    assert r.status == "failed"
+    assert compile_jsonpath.cache_info().currsize == 1
@@ -64,3 +64,18 @@ def test_as_dict_merge():
     d = pool.as_dict()
     assert d["a"] == 4
     assert d["b"] == 3
+
+
+def test_as_dict_cached_until_pool_changes():
+    """变量未变化时 as_dict 复用缓存；写入后重建，已取得的旧字典不受影响"""
+    pool = VariablePool()
+    pool.set_scenario({"a": 1})
+    first = pool.as_dict()
+    assert pool.as_dict() is first
+    pool.set("a", 2)
+    second = pool.as_dict()
+    assert second is not first
+    assert first == {"a": 1}
+    assert second == {"a": 2}
+    assert pool.snapshot() == second
+    assert pool.snapshot() is not second
@@ -13,6 +13,9 @@ from apirun.utils.functions import (
 )
 from apirun.utils.variables import (
     GLOBAL_PARAM_FUNCTIONS,
+    _compile_template,
+    _parse_call,
+    _parse_func_args,
     register_global_param_function,
     render_template,
 )
@@ -117,3 +120,50 @@ def test_variable_takes_precedence_over_global_func():
         assert out == "from_var"
     finally:
         GLOBAL_PARAM_FUNCTIONS.pop("foo", None)
+
+
+def test_render_template_reuses_compiled_template():
+    """同一模板字符串只解析一次，后续渲染命中缓存。"""
+    tpl = "/api/{{version}}/orders/{{order_id}}?compiled"
+    render_template(tpl, {"version": "v1", "order_id": 1})
+    hits_before = _compile_template.cache_info().hits
+    out = render_template(tpl, {"version": "v2", "order_id": 2})
+    assert out == "/api/v2/orders/2?compiled"
+    assert _compile_template.cache_info().hits == hits_before + 1
+
+
+def test_render_template_plain_string_skips_parsing():
+    """不含 {{ 的字符串原样返回，不进入模板解析。"""
+    tpl = "/api/v1/static/path?plain"
+    misses_before = _compile_template.cache_info().misses
+    assert render_template(tpl, {}) is tpl
+    assert _compile_template.cache_info().misses == misses_before
+
+
+def test_function_call_parsed_once_and_looked_up_each_time():
+    """函数表达式只解析一次；函数本身每次按名称查找，重新注册后立即生效。"""
+    try:
+        register_global_param_function("tag", lambda a, n: f"{a}-{n}")
+        assert render_template("{{tag('p', 1)}}", {}) == "p-1"
+        assert _parse_call("tag('p', 1)") == ("tag", ("p", 1))
+        hits_before = _parse_call.cache_info().hits
+        register_global_param_function("tag", lambda a, n: f"{n}:{a}")
+        assert render_template("{{tag('p', 1)}}", {}) == "1:p"
+        assert _parse_call.cache_info().hits > hits_before
+    finally:
+        GLOBAL_PARAM_FUNCTIONS.pop("tag", None)
+
+
+def test_parse_func_args_literal_types():
+    assert _parse_func_args("'a', \"b\", 12, -3, +4, 1_000, abc, 1x") == [
+        "a",
+        "b",
+        12,
+        -3,
+        4,
+        1000,
+        "abc",
+        "1x",
+    ]
+    # 引号需首尾成对且同类才视为字符串字面量
+    assert _parse_func_args('\'a", "", \'') == ["'a\"", "", "'"]